@@ -4,31 +4,44 @@ Skill Analyzer - Extracts key information from a skill for description optimizat
 
 Usage:
     python analyze_skill.py /path/to/skill-folder
+    python analyze_skill.py --batch /path/to/skills/*
 
 Outputs structured analysis to inform description optimization.
 """
 
 import sys
 import re
+import multiprocessing
+import textwrap
 import yaml
 from pathlib import Path
 from collections import Counter
+from itertools import filterfalse
+from types import MappingProxyType
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
 
 # Keywords that suggest trigger scenarios
-ACTION_VERBS = {
+ACTION_VERBS = frozenset({
     'create', 'build', 'generate', 'make', 'write', 'produce',
     'edit', 'modify', 'update', 'change', 'fix', 'revise',
     'analyze', 'extract', 'process', 'parse', 'read', 'examine',
     'convert', 'transform', 'merge', 'split', 'combine',
     'fill', 'complete', 'validate', 'verify', 'check',
     'format', 'style', 'design', 'layout', 'render'
-}
-
-# Primary file extension patterns (what the skill processes, not code/doc files)
-PRIMARY_EXTENSIONS = re.compile(r'\.(docx|xlsx|pdf|pptx|csv|tsv|json|xml|html)\b', re.IGNORECASE)
+})
 
-# All file extensions for reference
-ALL_EXTENSIONS = re.compile(r'\.(docx|xlsx|pdf|pptx|csv|tsv|json|xml|html|md|txt|py|js|ts|jsx|tsx|yaml|yml|png|jpg|jpeg|gif|svg)\b', re.IGNORECASE)
+# File extensions, tagged as primary (what the skill processes),
+# media (other non-code files) or code (code/config/doc files)
+_EXT_RE = re.compile(
+    r'\.(?:(?P<primary>docx|xlsx|pdf|pptx|csv|tsv|json|xml|html)'
+    r'|(?P<media>png|jpg|jpeg|gif|svg)'
+    r'|(?P<code>md|txt|py|js|ts|jsx|tsx|yaml|yml))\b'
+)
 
 # Heading patterns that suggest use cases
 USE_CASE_PATTERNS = [
@@ -37,122 +50,202 @@ USE_CASE_PATTERNS = [
     r'##\s*(when to use|getting started|quick start)',
 ]
 
+# Separates the readable report from the JSON consumed by generate_description.py
+RAW_ANALYSIS_MARKER = "--- RAW ANALYSIS (for generate_description.py) ---"
+
+# Possessive quantifier suffix (re supports them from Python 3.11). Only used
+# where the next token can never match what the quantifier consumed, so the
+# match results are identical and failing matches cannot backtrack.
+_POSSESSIVE = '+' if sys.version_info >= (3, 11) else ''
+
+# Pre-compiled patterns used on every analysis
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_BODY_RE = re.compile(r'^---\n.*?\n---\n?(.*)', re.DOTALL)
+_HEADING_RE = re.compile(r'^#{1,3}\s+(.+)$', re.MULTILINE)
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+_CODECHAR_RE = re.compile(r'[(){}\[\]"\'=<>]')
+
+# Description quality checks, fused into one scan keyed by group name
+_QA_RE = re.compile(
+    r'(?P<trigger>use (?:this skill )?when|when claude needs)'
+    rf'|(?P<enum>\(\d+{_POSSESSIVE}\))'
+    r'|(?P<angle>[<>])'
+    r'|(?P<antipat>see skill\.md|refer to|see below)',
+    re.IGNORECASE,
+)
+
+# Meta-headings that describe the doc, not use cases
+_SKIP_PATTERNS = (
+    'overview', 'guide', 'introduction', 'quick start', 'getting started',
+    'reference', 'installation', 'setup', 'requirements', 'prerequisites',
+    'python', 'javascript', 'bash', 'example', 'output',
+)
+_SKIP_RE = re.compile('|'.join(map(re.escape, _SKIP_PATTERNS)))
+
+# Heading keywords that indicate a workflow
+_WORKFLOW_KEYWORDS = (
+    'creating', 'editing', 'reading', 'analyzing', 'converting',
+    'processing', 'filling', 'generating', 'building', 'extracting',
+    'merging', 'splitting', 'validating', 'formatting',
+)
+_WORKFLOW_RE = re.compile('|'.join(map(re.escape, _WORKFLOW_KEYWORDS)))
+
+# Generic scenarios for verb stems found in the body, in priority order
+_VERB_TO_SCENARIO = MappingProxyType({
+    'creat': 'Creating new content',
+    'edit': 'Editing existing content',
+    'extract': 'Extracting data',
+    'merg': 'Merging files',
+    'split': 'Splitting documents',
+    'fill': 'Filling forms',
+    'generat': 'Generating output',
+    'convert': 'Converting formats',
+    'read': 'Reading content',
+    'analyz': 'Analyzing data',
+})
+
+# Maps every ASCII non-word byte to a space, so split() yields words. UTF-8
+# bytes of non-ASCII characters (>= 0x80) are kept inside their tokens.
+_WORD_TABLE = bytes(c if c >= 128 or chr(c).isalnum() or c == 95 else 32 for c in range(256))
+_ACTION_VERB_BYTES = frozenset(verb.encode() for verb in ACTION_VERBS)
+
+# Technology indicators searched for in the skill content, each with literal
+# markers that any match must contain so the regex can be skipped cheaply
+_CODE_PATTERNS_RE = {
+    'python': (('```python', 'import ', 'def '), re.compile(rf'```python|import \w+|def \w+{_POSSESSIVE}\(')),
+    'javascript': (('```javascript', '```js', 'require(', 'import '),
+                   re.compile(r'```javascript|```js|require\(|import .+ from')),
+    'bash': (('```bash', '```sh', '$ '), re.compile(r'```bash|```sh|\$ [a-z]')),
+    'has_scripts': (('scripts/',), re.compile(rf'scripts/\w+{_POSSESSIVE}\.(?:py|sh)')),
+}
+
 
 def extract_frontmatter(content: str) -> dict:
     """Extract YAML frontmatter from SKILL.md content."""
     if not content.startswith('---'):
         return {}
     
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}
     
+    return load_frontmatter(match.group(1))
+
+
+def load_frontmatter(text: str) -> dict:
+    """Parse a YAML frontmatter block, returning {} if it is empty or invalid."""
     try:
-        return yaml.safe_load(match.group(1)) or {}
+        return yaml.load(text, Loader=_YAMLLoader) or {}
     except yaml.YAMLError:
         return {}
 
 
 def extract_body(content: str) -> str:
     """Extract markdown body (after frontmatter)."""
-    match = re.match(r'^---\n.*?\n---\n?(.*)', content, re.DOTALL)
+    match = _BODY_RE.match(content)
     return match.group(1) if match else content
 
 
-def find_file_types(content: str) -> list:
-    """Find primary file extensions mentioned in the content."""
-    # First try primary extensions (actual document formats)
-    primary_matches = PRIMARY_EXTENSIONS.findall(content)
-    if primary_matches:
-        extensions = list(set(ext.lower() for ext in primary_matches))
-        return sorted(extensions)
+def split_frontmatter(data: bytes) -> tuple:
+    """Split raw SKILL.md bytes into (frontmatter, body) memoryviews, without copying or decoding."""
+    view = memoryview(data)
+    if not data.startswith(b'---\n'):
+        return view[:0], view
+    
+    end = data.find(b'\n---', 4)
+    if end == -1:
+        return view[:0], view
+    
+    body_start = end + 4
+    if data.startswith(b'\n', body_start):
+        body_start += 1
+    return view[4:end], view[body_start:]
+
+
+def find_file_types(*contents_lower: str) -> list:
+    """Find primary file extensions mentioned in the contents (must already be lowercased)."""
+    found = {'primary': set(), 'media': set(), 'code': set()}
+    for content_lower in contents_lower:
+        for match in _EXT_RE.finditer(content_lower):
+            found[match.lastgroup].add(match.group(match.lastgroup))
     
-    # Fall back to all extensions
-    all_matches = ALL_EXTENSIONS.findall(content)
-    extensions = list(set(ext.lower() for ext in all_matches))
-    # Filter out code/config files unless that's all there is
-    doc_exts = [e for e in extensions if e not in ['py', 'js', 'ts', 'jsx', 'tsx', 'yaml', 'yml', 'md', 'txt']]
-    return sorted(doc_exts) if doc_exts else sorted(extensions)
-
-
-def find_action_verbs(content: str) -> list:
-    """Find action verbs used in the content."""
-    words = re.findall(r'\b[a-z]+\b', content.lower())
-    found = [w for w in words if w in ACTION_VERBS]
+    # Prefer primary extensions (actual document formats), then media files,
+    # and only report code/config files if that's all there is
+    if found['primary']:
+        return sorted(found['primary'])
+    if found['media']:
+        return sorted(found['media'])
+    return sorted(found['code'])
+
+
+def find_action_verbs(content_lower: str) -> list:
+    """Find action verbs used in the content (must already be lowercased)."""
+    # Tokenize the UTF-8 bytes: bytes.translate() stays a C table lookup even
+    # when the text has non-ASCII characters, where str.translate() would not
+    words = content_lower.encode().translate(_WORD_TABLE).split()
+    if not content_lower.isascii():
+        # Non-ASCII tokens never equal a verb, but \b can still find one inside
+        # them ('fix—it'). Only when that happens are they re-split with the
+        # regex, in place so verbs keep their first-seen order.
+        if any(not ACTION_VERBS.isdisjoint(_WORD_RE.findall(token.decode()))
+               for token in filterfalse(bytes.isascii, words)):
+            words = (word for token in words
+                     for word in ((token,) if token.isascii()
+                                  else [w.encode() for w in _WORD_RE.findall(token.decode())]))
+    # Filter and count in C, without an intermediate list of hits
+    counter = Counter(filter(_ACTION_VERB_BYTES.__contains__, words))
     # Return by frequency
-    counter = Counter(found)
-    return [verb for verb, _ in counter.most_common(10)]
+    return [verb.decode() for verb, _ in counter.most_common(10)]
 
 
-def extract_headings(content: str) -> list:
-    """Extract markdown headings that might indicate use cases."""
-    headings = re.findall(r'^#{1,3}\s+(.+)$', content, re.MULTILINE)
-    return headings
+def extract_headings(content: str) -> tuple:
+    """Extract markdown headings that might indicate use cases, plus their lowercased forms."""
+    headings = []
+    headings_lower = []
+    for match in _HEADING_RE.finditer(content):
+        heading = match.group(1)
+        headings.append(heading)
+        headings_lower.append(heading.lower())
+    return headings, headings_lower
 
 
-def find_code_patterns(content: str) -> dict:
-    """Analyze code blocks for technology indicators."""
-    patterns = {
-        'python': bool(re.search(r'```python|import \w+|def \w+\(', content)),
-        'javascript': bool(re.search(r'```javascript|```js|require\(|import .+ from', content)),
-        'bash': bool(re.search(r'```bash|```sh|\$ [a-z]', content)),
-        'has_scripts': bool(re.search(r'scripts/\w+\.py|scripts/\w+\.sh', content)),
-    }
-    return {k: v for k, v in patterns.items() if v}
+def find_code_patterns(*contents: str) -> dict:
+    """Analyze code blocks for technology indicators across the given contents."""
+    patterns = {}
+    for name, (markers, pattern) in _CODE_PATTERNS_RE.items():
+        for content in contents:
+            if any(marker in content for marker in markers) and pattern.search(content):
+                patterns[name] = True
+                break
+    return patterns
+
 
+def scan_description(desc: str) -> Counter:
+    """Count quality-check hits (trigger, enum, angle, antipat) in one pass."""
+    return Counter(match.lastgroup for match in _QA_RE.finditer(desc))
 
-def estimate_scenarios(headings: list, body: str) -> list:
-    """Estimate likely usage scenarios from content analysis."""
+
+def estimate_scenarios(headings: list, headings_lower: list, body_lower: str) -> list:
+    """Estimate likely usage scenarios from content analysis (lowercased inputs precomputed)."""
     scenarios = []
     
-    # Skip meta-headings that describe the doc, not use cases
-    skip_patterns = ['overview', 'guide', 'introduction', 'quick start', 'getting started', 
-                     'reference', 'installation', 'setup', 'requirements', 'prerequisites',
-                     'python', 'javascript', 'bash', 'example', 'output']
-    
-    # Check headings for workflow indicators
-    workflow_keywords = ['creating', 'editing', 'reading', 'analyzing', 'converting', 
-                         'processing', 'filling', 'generating', 'building', 'extracting',
-                         'merging', 'splitting', 'validating', 'formatting']
-    
-    for heading in headings:
-        heading_lower = heading.lower()
+    for heading, heading_lower in zip(headings, headings_lower):
         # Skip meta-headings and code-like content
-        if any(skip in heading_lower for skip in skip_patterns):
+        if _SKIP_RE.search(heading_lower):
             continue
         # Skip if looks like code (has special chars)
-        if re.search(r'[(){}\[\]"\'=<>]', heading):
+        if _CODECHAR_RE.search(heading):
             continue
-        for keyword in workflow_keywords:
-            if keyword in heading_lower:
-                clean = heading.strip().rstrip(':')
-                if 5 < len(clean) < 50:
-                    scenarios.append(clean)
-                break
+        # Check headings for workflow indicators
+        if _WORKFLOW_RE.search(heading_lower):
+            clean = heading.strip().rstrip(':')
+            if 5 < len(clean) < 50:
+                scenarios.append(clean)
     
     # If not enough scenarios from headings, generate generic ones from verbs
     if len(scenarios) < 3:
-        verbs_found = set()
-        for verb in ['creat', 'edit', 'extract', 'merg', 'split', 'fill', 'generat', 'convert', 'read', 'analyz']:
-            if verb in body.lower():
-                verbs_found.add(verb)
-        
-        verb_to_scenario = {
-            'creat': 'Creating new content',
-            'edit': 'Editing existing content', 
-            'extract': 'Extracting data',
-            'merg': 'Merging files',
-            'split': 'Splitting documents',
-            'fill': 'Filling forms',
-            'generat': 'Generating output',
-            'convert': 'Converting formats',
-            'read': 'Reading content',
-            'analyz': 'Analyzing data'
-        }
-        
-        for verb in list(verbs_found)[:5 - len(scenarios)]:
-            if verb in verb_to_scenario:
-                scenarios.append(verb_to_scenario[verb])
+        found = [scenario for verb, scenario in _VERB_TO_SCENARIO.items() if verb in body_lower]
+        scenarios.extend(found[:5 - len(scenarios)])
     
     return scenarios[:5]
 
@@ -164,10 +257,24 @@ def analyze_skill(skill_path: Path) -> dict:
     if not skill_md.exists():
         return {'error': f'SKILL.md not found in {skill_path}'}
     
-    content = skill_md.read_text()
-    frontmatter = extract_frontmatter(content)
-    body = extract_body(content)
-    headings = extract_headings(body)
+    data = skill_md.read_bytes()
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    
+    # Only the frontmatter and body slices are decoded, each exactly once,
+    # straight from views into the raw bytes
+    frontmatter_view, body_view = split_frontmatter(data)
+    frontmatter_text = str(frontmatter_view, 'utf-8')
+    body = str(body_view, 'utf-8')
+    frontmatter_view.release()
+    body_view.release()
+    del data
+    frontmatter = load_frontmatter(frontmatter_text) if frontmatter_text else {}
+    # Count lines before the lowercased copy exists, so the line list and
+    # both body strings are never alive at once
+    body_lines = len(body.splitlines())
+    body_lower = body.lower()
+    headings, headings_lower = extract_headings(body)
     
     # Check for bundled resources
     has_scripts = (skill_path / 'scripts').exists()
@@ -178,40 +285,50 @@ def analyze_skill(skill_path: Path) -> dict:
         'name': frontmatter.get('name', skill_path.name),
         'current_description': frontmatter.get('description', ''),
         'description_length': len(frontmatter.get('description', '')),
-        'file_types': find_file_types(content),
-        'action_verbs': find_action_verbs(body),
+        # Frontmatter is scanned too, so a file type only named in the description still counts
+        'file_types': find_file_types(frontmatter_text.lower(), body_lower),
+        'action_verbs': find_action_verbs(body_lower),
         'headings': headings,
-        'estimated_scenarios': estimate_scenarios(headings, body),
-        'technologies': find_code_patterns(content),
+        'headings_lower': headings_lower,
+        'estimated_scenarios': estimate_scenarios(headings, headings_lower, body_lower),
+        'technologies': find_code_patterns(frontmatter_text, body),
         'resources': {
             'scripts': has_scripts,
             'references': has_references,
             'assets': has_assets,
         },
-        'body_lines': len(body.splitlines()),
+        'body_lines': body_lines,
     }
+    analysis['file_types_dotted'] = tuple(f'.{ext}' for ext in analysis['file_types'])
     
     # Quality checks on current description
     desc = analysis['current_description']
+    desc_lower = desc.lower()
+    file_types = analysis['file_types']
+    flags = scan_description(desc)
     analysis['quality_issues'] = []
     
     if len(desc) < 50:
         analysis['quality_issues'].append('Description too short (< 50 chars)')
     if len(desc) > 1024:
         analysis['quality_issues'].append(f'Description too long ({len(desc)} > 1024 chars)')
-    if '<' in desc or '>' in desc:
+    if flags['angle']:
         analysis['quality_issues'].append('Contains forbidden angle brackets')
-    if not re.search(r'(use this skill when|when claude needs|use when)', desc.lower()):
+    if not flags['trigger']:
         analysis['quality_issues'].append('Missing trigger phrase (Use this skill when...)')
-    if not re.search(r'\(\d+\)', desc):
+    if not flags['enum']:
         analysis['quality_issues'].append('No enumerated scenarios (1), (2), (3)...')
-    if not analysis['file_types'] or not any(ext in desc.lower() for ext in analysis['file_types']):
-        if analysis['file_types']:
-            analysis['quality_issues'].append(f'File types {analysis["file_types"]} not in description')
+    if file_types and not any(ext in desc_lower for ext in file_types):
+        analysis['quality_issues'].append(f'File types {file_types} not in description')
     
     return analysis
 
 
+def wrap_text(text: str, width: int = 70, indent: str = '   ') -> str:
+    """Word-wrap text into indented lines, ready for a single print()."""
+    return textwrap.fill(text, width + len(indent), initial_indent=indent, subsequent_indent=indent)
+
+
 def print_analysis(analysis: dict):
     """Print analysis in a readable format."""
     if 'error' in analysis:
@@ -225,11 +342,7 @@ def print_analysis(analysis: dict):
     print("📋 CURRENT DESCRIPTION:")
     print(f"   Length: {analysis['description_length']} / 1024 chars")
     if analysis['current_description']:
-        # Word wrap the description
-        desc = analysis['current_description']
-        wrapped = [desc[i:i+70] for i in range(0, len(desc), 70)]
-        for line in wrapped:
-            print(f"   {line}")
+        print(wrap_text(analysis['current_description']))
     else:
         print("   (empty)")
     
@@ -259,9 +372,29 @@ def print_analysis(analysis: dict):
     print(f"\n{'='*60}\n")
 
 
+def _analyze_safe(skill_path: Path) -> dict:
+    """Analyze a skill in a batch worker, turning failures into an error report."""
+    try:
+        return analyze_skill(skill_path)
+    except Exception as e:
+        return {'error': f'{skill_path}: {type(e).__name__}: {e}'}
+
+
+def analyze_batch(skill_paths: list):
+    """Analyze many skills in parallel, printing each report in input order."""
+    with multiprocessing.Pool() as pool:
+        for analysis in pool.imap(_analyze_safe, skill_paths, chunksize=4):
+            print_analysis(analysis)
+
+
 def main():
-    if len(sys.argv) != 2:
+    if len(sys.argv) > 2 and sys.argv[1] == '--batch':
+        analyze_batch([Path(p).resolve() for p in sys.argv[2:]])
+        return
+    
+    if len(sys.argv) != 2 or sys.argv[1] == '--batch':
         print("Usage: python analyze_skill.py /path/to/skill-folder")
+        print("       python analyze_skill.py --batch /path/to/skills/*")
         sys.exit(1)
     
     skill_path = Path(sys.argv[1]).resolve()
@@ -274,7 +407,7 @@ def main():
     print_analysis(analysis)
     
     # Also output as parseable format for piping to generator
-    print("--- RAW ANALYSIS (for generate_description.py) ---")
+    print(RAW_ANALYSIS_MARKER)
     import json
     print(json.dumps(analysis, indent=2))
 
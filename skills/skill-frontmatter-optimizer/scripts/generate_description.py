@@ -4,6 +4,7 @@ Description Generator - Creates optimized frontmatter descriptions for skills.
 
 Usage:
     python generate_description.py /path/to/skill-folder
+    python analyze_skill.py /path/to/skill-folder | python generate_description.py -
 
 Analyzes the skill and generates an optimized description following production patterns.
 """
@@ -12,14 +13,35 @@ import sys
 import re
 import yaml
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 # Import analyzer functions
-from analyze_skill import analyze_skill, extract_frontmatter, extract_body
+from analyze_skill import (
+    analyze_skill, extract_frontmatter, extract_body, scan_description, wrap_text,
+    RAW_ANALYSIS_MARKER,
+)
 
 MAX_DESCRIPTION_LENGTH = 1024
 
+# Possessive quantifier suffix (re supports them from Python 3.11), used only
+# where it cannot change match results
+_POSSESSIVE = '+' if sys.version_info >= (3, 11) else ''
+
+# Pre-compiled patterns for scoring, suggestions and cleanup
+_USE_WHEN_RE = re.compile(r'use (this skill )?when')
+_ENUM_RE = re.compile(rf'\(\d+{_POSSESSIVE}\)')
+_ANTI_RE = re.compile(r'see skill\.md|refer to|see below')
+_CATCHALL_RE = re.compile(r'or any other|or other')
+_EXAMPLES_RE = re.compile(r'examples? include|such as|e\.g\.|including')
+_EXAMPLES_TRIM_RE = re.compile(rf'\(examples include[^)]+{_POSSESSIVE}\)')
+_ENUM_TRIM_RE = re.compile(rf'\(\d+{_POSSESSIVE}\)[^,]+{_POSSESSIVE},?\s*')
+
+# Heading keywords used to classify skill types
+_REFERENCE_RE = re.compile(r'reference|documentation|api|schema')
+_WORKFLOW_RE = re.compile(r'workflow|step|process|pipeline')
+
 # Templates for different skill types
 TEMPLATES = {
     'file_processor': (
@@ -45,21 +67,35 @@ TEMPLATES = {
 }
 
 
+def get_headings_lower(analysis: dict) -> list:
+    """Lowercased headings, computed here if the analysis doesn't carry them."""
+    if 'headings_lower' in analysis:
+        return analysis['headings_lower']
+    return [h.lower() for h in analysis.get('headings', [])]
+
+
+def get_file_types_dotted(analysis: dict) -> tuple:
+    """File types as '.ext' strings, computed here if the analysis doesn't carry them."""
+    if 'file_types_dotted' in analysis:
+        return tuple(analysis['file_types_dotted'])
+    return tuple(f'.{ext}' for ext in analysis.get('file_types', []))
+
+
 def classify_skill_type(analysis: dict) -> str:
     """Determine the type of skill based on analysis."""
     file_types = analysis.get('file_types', [])
-    headings = [h.lower() for h in analysis.get('headings', [])]
+    headings = ' '.join(get_headings_lower(analysis))
     
     # File processor if handles specific file types
     if file_types and any(ext in ['docx', 'pdf', 'xlsx', 'pptx', 'csv'] for ext in file_types):
         return 'file_processor'
     
     # Knowledge reference if has reference-like headings
-    if any(kw in ' '.join(headings) for kw in ['reference', 'documentation', 'api', 'schema']):
+    if _REFERENCE_RE.search(headings):
         return 'knowledge_reference'
     
     # Workflow if has step-based content
-    if any(kw in ' '.join(headings) for kw in ['workflow', 'step', 'process', 'pipeline']):
+    if _WORKFLOW_RE.search(headings):
         return 'workflow_automation'
     
     # Default to tool integration
@@ -150,14 +186,13 @@ def generate_catchall(analysis: dict) -> str:
 
 def generate_examples(analysis: dict) -> str:
     """Generate example triggers."""
-    headings = analysis.get('headings', [])
+    headings_lower = get_headings_lower(analysis)
     
     # Extract actionable headings
     examples = []
-    for h in headings[:6]:
-        h_lower = h.lower()
+    for h_lower in headings_lower[:6]:
         if any(kw in h_lower for kw in ['creating', 'editing', 'reading', 'converting', 'processing', 'building']):
-            examples.append(h.lower().strip())
+            examples.append(h_lower.strip())
     
     if examples:
         return ', '.join(examples[:4])
@@ -209,17 +244,17 @@ def generate_optimized_description(analysis: dict) -> str:
         )
     
     # Ensure under limit
-    if len(description) > MAX_DESCRIPTION_LENGTH:
+    if len(description) > MAX_DESCRIPTION_LENGTH and '(examples include' in description:
         # Truncate examples first
-        description = re.sub(r'\(examples include[^)]+\)', '', description)
+        description = _EXAMPLES_TRIM_RE.sub('', description)
         description = description.strip()
     
-    if len(description) > MAX_DESCRIPTION_LENGTH:
+    if len(description) > MAX_DESCRIPTION_LENGTH and '(' in description:
         # Reduce scenarios
-        description = re.sub(r'\(\d+\)[^,]+,?\s*', '', description, count=2)
+        description = _ENUM_TRIM_RE.sub('', description, count=2)
     
     # Final cleanup
-    description = re.sub(r'\s+', ' ', description).strip()
+    description = ' '.join(description.split())
     description = description.rstrip(',.')
     
     return description
@@ -228,19 +263,18 @@ def generate_optimized_description(analysis: dict) -> str:
 def suggest_improvements(current: str, generated: str, analysis: dict) -> list:
     """Suggest specific improvements to make."""
     suggestions = []
+    current_lower = current.lower()
     
     # Check for missing elements
-    if not re.search(r'use (this skill )?when', current.lower()):
+    if not _USE_WHEN_RE.search(current_lower):
         suggestions.append("ADD trigger phrase: 'Use this skill when...'")
     
-    if not re.search(r'\(\d+\)', current):
+    if not _ENUM_RE.search(current):
         suggestions.append("ADD enumerated scenarios: (1) Creating, (2) Editing, etc.")
     
-    file_types = analysis.get('file_types', [])
-    if file_types:
-        missing_exts = [ext for ext in file_types if f'.{ext}' not in current.lower()]
-        if missing_exts:
-            suggestions.append(f"ADD file extensions: {', '.join('.' + e for e in missing_exts[:3])}")
+    missing_exts = [ext for ext in get_file_types_dotted(analysis) if ext not in current_lower]
+    if missing_exts:
+        suggestions.append(f"ADD file extensions: {', '.join(missing_exts[:3])}")
     
     if len(current) < 100:
         suggestions.append("EXPAND: Description is too short for reliable matching")
@@ -249,18 +283,21 @@ def suggest_improvements(current: str, generated: str, analysis: dict) -> list:
         suggestions.append("TRIM: Near character limit, prioritize triggers over features")
     
     # Check for anti-patterns
-    if re.search(r'see skill\.md|refer to|see below', current.lower()):
+    if _ANTI_RE.search(current_lower):
         suggestions.append("REMOVE: References to body content (body is invisible before triggering)")
     
     return suggestions
 
 
-def score_description(description: str, analysis: dict) -> int:
+@lru_cache(maxsize=4096)
+def score_description(description: str, file_types_dotted: tuple) -> int:
     """Score a description based on best practices (0-100)."""
     if not description:
         return 0
     
     score = 0
+    desc_lower = description.lower()
+    flags = scan_description(description)
     
     # Length check (10 points)
     if 100 <= len(description) <= 800:
@@ -269,58 +306,76 @@ def score_description(description: str, analysis: dict) -> int:
         score += 5
     
     # Has trigger phrase (20 points)
-    if re.search(r'use (this skill )?when|when claude needs', description.lower()):
+    if flags['trigger']:
         score += 20
     
     # Has enumerated scenarios (20 points)
-    enum_count = len(re.findall(r'\(\d+\)', description))
+    enum_count = flags['enum']
     if enum_count >= 3:
         score += 20
     elif enum_count >= 1:
         score += 10
     
     # Has file types if skill handles files (15 points)
-    file_types = analysis.get('file_types', [])
-    if file_types:
-        mentioned = sum(1 for ext in file_types if f'.{ext}' in description.lower())
+    if file_types_dotted:
+        mentioned = sum(1 for ext in file_types_dotted if ext in desc_lower)
         if mentioned > 0:
             score += 15
     else:
         score += 15  # No file types to check
     
     # Has catch-all phrase (10 points)
-    if re.search(r'or any other|or other', description.lower()):
+    if _CATCHALL_RE.search(desc_lower):
         score += 10
     
     # Has examples (10 points)
-    if re.search(r'examples? include|such as|e\.g\.|including', description.lower()):
+    if _EXAMPLES_RE.search(desc_lower):
         score += 10
     
     # No anti-patterns (15 points)
-    has_antipattern = False
-    if re.search(r'see skill\.md|refer to|see below', description.lower()):
-        has_antipattern = True
-    if '<' in description or '>' in description:
-        has_antipattern = True
-    if not has_antipattern:
+    if not flags['antipat'] and not flags['angle']:
         score += 15
     
     return score
 
 
+def read_analysis(stream) -> dict:
+    """Read analysis JSON, either raw or as printed by analyze_skill.py."""
+    text = stream.read()
+    _, marker, raw = text.partition(RAW_ANALYSIS_MARKER)
+    try:
+        analysis = json.loads(raw if marker else text)
+    except json.JSONDecodeError as e:
+        return {'error': f'Invalid analysis on stdin: {e}'}
+    
+    if not isinstance(analysis, dict):
+        return {'error': f'Invalid analysis on stdin: expected an object, got {type(analysis).__name__}'}
+    if 'error' in analysis:
+        return analysis
+    missing = [key for key in ('name', 'current_description') if key not in analysis]
+    if missing:
+        return {'error': f"Invalid analysis on stdin: missing {', '.join(missing)}"}
+    return analysis
+
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python generate_description.py /path/to/skill-folder")
+        print("       python analyze_skill.py /path/to/skill-folder | python generate_description.py -")
         sys.exit(1)
     
-    skill_path = Path(sys.argv[1]).resolve()
-    
-    if not skill_path.exists():
-        print(f"❌ Path not found: {skill_path}")
-        sys.exit(1)
-    
-    # Analyze the skill
-    analysis = analyze_skill(skill_path)
+    if sys.argv[1] == '-':
+        # Reuse an existing analysis instead of analyzing the skill again
+        analysis = read_analysis(sys.stdin)
+    else:
+        skill_path = Path(sys.argv[1]).resolve()
+        
+        if not skill_path.exists():
+            print(f"❌ Path not found: {skill_path}")
+            sys.exit(1)
+        
+        # Analyze the skill
+        analysis = analyze_skill(skill_path)
     
     if 'error' in analysis:
         print(f"❌ {analysis['error']}")
@@ -330,8 +385,9 @@ def main():
     generated = generate_optimized_description(analysis)
     suggestions = suggest_improvements(current, generated, analysis)
     
-    current_score = score_description(current, analysis)
-    generated_score = score_description(generated, analysis)
+    file_types_dotted = get_file_types_dotted(analysis)
+    current_score = score_description(current, file_types_dotted)
+    generated_score = score_description(generated, file_types_dotted)
     
     print(f"\n{'='*60}")
     print(f"DESCRIPTION OPTIMIZATION: {analysis['name']}")
@@ -340,15 +396,13 @@ def main():
     print("📋 CURRENT DESCRIPTION:")
     print(f"   ({len(current)} chars, score: {current_score}/100)")
     if current:
-        for i in range(0, len(current), 70):
-            print(f"   {current[i:i+70]}")
+        print(wrap_text(current))
     else:
         print("   (empty)")
     
     print(f"\n✨ GENERATED DESCRIPTION:")
     print(f"   ({len(generated)} chars, score: {generated_score}/100)")
-    for i in range(0, len(generated), 70):
-        print(f"   {generated[i:i+70]}")
+    print(wrap_text(generated))
     
     # Recommendation
     print(f"\n📊 RECOMMENDATION:")